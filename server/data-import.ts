@@ -1,11 +1,14 @@
-import { db } from "./db";
-import { patients, users, patient_tests, inventory_items, vendors, purchase_orders } from "../shared/schema";
-import type { DatabaseStorage } from "./storage";
+import type { PoolClient } from "pg";
+import { db, pool } from "./db";
+import { patients, patientTests, inventoryItems, vendors, transactions } from "../shared/schema";
+import type { InsertPatient } from "../shared/schema";
+import { storage, type DatabaseStorage } from "./storage";
 
 interface ImportResult {
   success: boolean;
   message: string;
   recordsProcessed: number;
+  totalRecords: number;
   errors: string[];
 }
 
@@ -33,6 +36,17 @@ interface TestImportData {
   paymentMethod?: string;
 }
 
+interface TransactionImportData {
+  type?: string;
+  category?: string;
+  amount: number | string;
+  description?: string;
+  transactionDate: string;
+  paymentMethod?: string;
+  referenceNumber?: string;
+  status?: string;
+}
+
 interface InventoryImportData {
   itemCode: string;
   name: string;
@@ -57,6 +71,459 @@ interface VendorImportData {
   taxId?: string;
 }
 
+// Rows per column-array statement. These bind one parameter per column
+// regardless of row count, so the bind-parameter limit does not apply;
+// beyond a few thousand rows the gain flattens while isolating a bad record
+// in a batch gets costlier.
+const COLUMN_ARRAY_BATCH_SIZE = 2000;
+
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+// Anything other than digits and the leading international '+' in a phone
+// number: spaces, dashes, dots and brackets from spreadsheet formatting
+const PHONE_NOISE_PATTERN = /(?!^\+)[^\d]/g;
+
+// Spreadsheet exports mix strings, numbers and padded blanks in text fields
+function cleanText(value: unknown): string {
+  return value === undefined || value === null ? '' : `${value}`.trim();
+}
+
+function normalizePhone(phone?: string | number): string {
+  return cleanText(phone).replace(PHONE_NOISE_PATTERN, '');
+}
+
+// Spellings found in historical exports, decided once here rather than
+// re-derived for every record
+const GENDER_ALIASES = new Map<string, string>([
+  ['m', 'male'],
+  ['male', 'male'],
+  ['f', 'female'],
+  ['female', 'female'],
+  ['o', 'other'],
+  ['other', 'other']
+]);
+
+function normalizeGender(gender?: string): string {
+  const key = cleanText(gender).toLowerCase();
+  if (!key) return 'unknown';
+  return GENDER_ALIASES.get(key) ?? key;
+}
+
+// Historical records without a birth date are filed under a fixed placeholder
+const DEFAULT_DATE_OF_BIRTH = new Date('1990-01-01');
+
+// Map an incoming record onto patients table columns, ahead of the insert
+// that consumes it.
+function normalizePatientRow(patientData: PatientImportData, patientId: string): InsertPatient {
+  return {
+    patientId,
+    tenantId: 1,
+    branchId: 1,
+    firstName: cleanText(patientData.firstName),
+    lastName: cleanText(patientData.lastName),
+    email: cleanText(patientData.email),
+    phone: normalizePhone(patientData.phone),
+    dateOfBirth: patientData.dateOfBirth ? new Date(patientData.dateOfBirth) : DEFAULT_DATE_OF_BIRTH,
+    gender: normalizeGender(patientData.gender),
+    address: cleanText(patientData.address),
+    // Referral pathways need a referral provider, which imports do not carry
+    pathway: 'self'
+  };
+}
+
+// Yield the source records a batch at a time, transformed on demand, so only
+// the batch being written is held in normalized form.
+function* inBatches<S, T>(
+  source: S[],
+  transform: (item: S, index: number) => T,
+  batchSize: number
+): Generator<T[]> {
+  for (let start = 0; start < source.length; start += batchSize) {
+    const end = Math.min(start + batchSize, source.length);
+    const batch: T[] = [];
+    for (let index = start; index < end; index++) {
+      batch.push(transform(source[index], index));
+    }
+    yield batch;
+  }
+}
+
+// Re-send a rejected batch in halves, narrowing down to the records that
+// fail, so a bad record costs a few extra statements rather than one per
+// row. Each failing record is reported against its own description.
+async function retryInHalves<T>(
+  batch: T[],
+  error: any,
+  insertBatch: (batch: T[]) => Promise<number>,
+  describe: (row: T) => string,
+  errors: string[]
+): Promise<number> {
+  if (batch.length === 1) {
+    errors.push(`Failed to import ${describe(batch[0])}: ${error.message}`);
+    return 0;
+  }
+
+  const middle = Math.ceil(batch.length / 2);
+  let inserted = 0;
+  for (const half of [batch.slice(0, middle), batch.slice(middle)]) {
+    try {
+      inserted += await insertBatch(half);
+    } catch (halfError) {
+      inserted += await retryInHalves(half, halfError, insertBatch, describe, errors);
+    }
+  }
+  return inserted;
+}
+
+// Write each batch with one statement; insertBatch resolves to the number of
+// rows actually written. The next batch is prepared while the current write
+// is in flight, so normalization overlaps the database round trip instead
+// of adding to it. A rejected batch is split until its bad records are
+// isolated.
+async function insertInBatches<T>(
+  batches: Iterable<T[]>,
+  insertBatch: (batch: T[]) => Promise<number>,
+  describe: (row: T) => string,
+  errors: string[]
+): Promise<number> {
+  const iterator = batches[Symbol.iterator]();
+  let inserted = 0;
+  let next = iterator.next();
+
+  while (!next.done) {
+    const batch = next.value;
+    const pendingWrite = insertBatch(batch);
+    try {
+      next = iterator.next();
+    } catch (error) {
+      // A record that cannot be normalized aborts the import; let the write
+      // already queued settle first so the caller never rolls back or
+      // releases a connection with a statement still pending on it
+      await pendingWrite.catch(() => {});
+      throw error;
+    }
+
+    try {
+      inserted += await pendingWrite;
+    } catch (error) {
+      inserted += await retryInHalves(batch, error, insertBatch, describe, errors);
+    }
+  }
+
+  return inserted;
+}
+
+// Drop records without a first or last name and records repeated within one
+// payload in a single pass, so each patient is inserted and given an ID only
+// once. A repeat needs the same name plus the same phone and birth date, at
+// least one of them given; same-named records with neither are kept, as they
+// may well be different people. Every dropped row is reported.
+function screenPatients(patientsData: PatientImportData[], errors: string[]): PatientImportData[] {
+  const firstRows = new Map<string, number>();
+  return patientsData.filter((patientData, index) => {
+    const firstName = cleanText(patientData.firstName);
+    const lastName = cleanText(patientData.lastName);
+    if (!firstName || !lastName) {
+      errors.push(`Row ${index + 1}: First name and last name are required`);
+      return false;
+    }
+    const phone = normalizePhone(patientData.phone);
+    const dateOfBirth = cleanText(patientData.dateOfBirth);
+    if (!phone && !dateOfBirth) return true;
+
+    const key = [firstName.toLowerCase(), lastName.toLowerCase(), phone, dateOfBirth].join('|');
+    const firstRow = firstRows.get(key);
+    if (firstRow !== undefined) {
+      errors.push(`Row ${index + 1}: duplicate of row ${firstRow + 1}`);
+      return false;
+    }
+    firstRows.set(key, index);
+    return true;
+  });
+}
+
+// Map an incoming ledger entry onto transactions table columns; the original
+// transaction date is kept as the record's creation time.
+function normalizeTransactionRow(
+  transaction: TransactionImportData,
+  createdBy: number
+): typeof transactions.$inferInsert {
+  return {
+    tenantId: 1,
+    branchId: 1,
+    type: transaction.type || 'income',
+    amount: cleanText(transaction.amount),
+    description: transaction.description || '',
+    paymentMethod: transaction.paymentMethod || 'cash',
+    createdBy,
+    createdAt: new Date(transaction.transactionDate)
+  };
+}
+
+function normalizePatientTestRow(
+  testData: TestImportData,
+  verifiedAt: Date
+): typeof patientTests.$inferInsert {
+  const testDate = new Date(testData.testDate);
+  const paid = testData.paymentStatus === 'paid';
+  return {
+    patientId: testData.patientId,
+    testId: testData.testId,
+    tenantId: 1,
+    branchId: 1,
+    status: testData.status,
+    scheduledAt: testDate,
+    completedAt: testData.status === 'completed' ? testDate : null,
+    results: testData.results || '',
+    paymentVerified: paid,
+    paymentVerifiedAt: paid ? verifiedAt : null
+  };
+}
+
+// Run a write inside a savepoint so a failed batch can be rolled back and
+// retried without aborting the surrounding import transaction. The write is
+// queued straight behind SAVEPOINT rather than after its reply: node-postgres
+// sends a client's queries in order, so the batch statement is already on
+// its way while the caller prepares the next batch.
+async function withSavepoint<R>(client: PoolClient, write: () => Promise<R>): Promise<R> {
+  try {
+    const [, result] = await Promise.all([client.query('SAVEPOINT import_batch'), write()]);
+    await client.query('RELEASE SAVEPOINT import_batch');
+    return result;
+  } catch (error) {
+    await client.query('ROLLBACK TO SAVEPOINT import_batch');
+    throw error;
+  }
+}
+
+// Column-array insert statements. They run as named prepared statements,
+// so each pooled connection parses and plans them once and later batches
+// only send parameters.
+const INSERT_PATIENTS_BATCH_SQL = `
+  INSERT INTO patients
+    (patient_id, first_name, last_name, email, phone, date_of_birth,
+     gender, address, pathway, tenant_id, branch_id)
+  SELECT * FROM unnest(
+    $1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::timestamp[],
+    $7::text[], $8::text[], $9::text[], $10::int[], $11::int[]
+  )
+  ON CONFLICT (patient_id) DO NOTHING
+  RETURNING patient_id
+`;
+
+const INSERT_TRANSACTIONS_BATCH_SQL = `
+  INSERT INTO transactions
+    (type, amount, description, payment_method, created_by, created_at, tenant_id, branch_id)
+  SELECT * FROM unnest(
+    $1::text[], $2::numeric[], $3::text[], $4::text[],
+    $5::int[], $6::timestamp[], $7::int[], $8::int[]
+  )
+`;
+
+// Tests for unknown patients or patients outside the tenant are dropped by
+// the join; the patients written are returned so the rest can be reported
+const INSERT_PATIENT_TESTS_BATCH_SQL = `
+  INSERT INTO patient_tests
+    (patient_id, test_id, status, scheduled_at, completed_at, results,
+     payment_verified, payment_verified_at, tenant_id, branch_id)
+  SELECT u.* FROM unnest(
+    $1::int[], $2::int[], $3::text[], $4::timestamp[], $5::timestamp[], $6::text[],
+    $7::boolean[], $8::timestamp[], $9::int[], $10::int[]
+  ) AS u(patient_id, test_id, status, scheduled_at, completed_at, results,
+         payment_verified, payment_verified_at, tenant_id, branch_id)
+  JOIN patients p ON p.id = u.patient_id AND p.tenant_id = u.tenant_id
+  RETURNING patient_id
+`;
+
+// Run a batched import on one pooled connection inside a single transaction;
+// openBatches runs first on that connection, for any lookups the rows need.
+// Each write gets its own savepoint so a rejected batch can be retried in
+// parts; any other failure rolls the whole import back.
+async function importInTransaction<T>(
+  openBatches: (client: PoolClient) => Promise<Iterable<T[]>> | Iterable<T[]>,
+  insertBatch: (client: PoolClient, batch: T[]) => Promise<number>,
+  describe: (row: T) => string,
+  errors: string[]
+): Promise<number> {
+  const client = await pool.connect();
+  let releaseError: Error | undefined;
+  try {
+    await client.query('BEGIN');
+    const inserted = await insertInBatches(
+      await openBatches(client),
+      (batch) => withSavepoint(client, () => insertBatch(client, batch)),
+      describe,
+      errors
+    );
+    await client.query('COMMIT');
+    return inserted;
+  } catch (error) {
+    // A connection that cannot roll back is discarded rather than returned
+    // to the pool mid-transaction
+    await client.query('ROLLBACK').catch((rollbackError) => {
+      releaseError = rollbackError;
+    });
+    throw error;
+  } finally {
+    client.release(releaseError);
+  }
+}
+
+// Load a batch of patients as one column-array statement. The statement text
+// and its eleven parameters stay the same whatever the batch size, so the
+// server parses a fixed query instead of one with thousands of placeholders.
+// A generated ID can still collide with one taken by a registration made
+// while the import runs; such rows are skipped rather than failing the
+// batch, and reported.
+async function insertPatientBatch(
+  client: PoolClient,
+  batch: InsertPatient[],
+  errors: string[]
+): Promise<number> {
+  const size = batch.length;
+  const patientIds = new Array<string>(size);
+  const firstNames = new Array<string>(size);
+  const lastNames = new Array<string>(size);
+  const emails = new Array<string | null>(size);
+  const phones = new Array<string>(size);
+  const datesOfBirth = new Array<string | null>(size);
+  const genders = new Array<string | null>(size);
+  const addresses = new Array<string | null>(size);
+  const pathways = new Array<string>(size);
+  const tenantIds = new Array<number>(size);
+  const branchIds = new Array<number>(size);
+
+  // Fill every column in a single pass over the batch
+  for (let i = 0; i < size; i++) {
+    const row = batch[i];
+    patientIds[i] = row.patientId;
+    firstNames[i] = row.firstName;
+    lastNames[i] = row.lastName;
+    emails[i] = row.email ?? null;
+    phones[i] = row.phone;
+    datesOfBirth[i] = row.dateOfBirth ? row.dateOfBirth.toISOString() : null;
+    genders[i] = row.gender ?? null;
+    addresses[i] = row.address ?? null;
+    pathways[i] = row.pathway ?? 'self';
+    tenantIds[i] = row.tenantId;
+    branchIds[i] = row.branchId;
+  }
+
+  const result = await client.query({
+    name: 'import_patients_batch',
+    text: INSERT_PATIENTS_BATCH_SQL,
+    values: [
+      patientIds, firstNames, lastNames, emails, phones, datesOfBirth,
+      genders, addresses, pathways, tenantIds, branchIds
+    ]
+  });
+
+  if (result.rows.length < size) {
+    const written = new Set(result.rows.map((row) => row.patient_id));
+    for (const row of batch) {
+      if (!written.has(row.patientId)) {
+        errors.push(
+          `Failed to import patient ${row.firstName} ${row.lastName}: patient ID ${row.patientId} is already in use`
+        );
+      }
+    }
+  }
+  return result.rows.length;
+}
+
+// Load a batch of ledger entries as one column-array statement, as for patients.
+async function insertTransactionBatch(
+  client: PoolClient,
+  batch: (typeof transactions.$inferInsert)[]
+): Promise<number> {
+  const size = batch.length;
+  const types = new Array<string>(size);
+  const amounts = new Array<string>(size);
+  const descriptions = new Array<string | null>(size);
+  const paymentMethods = new Array<string | null>(size);
+  const createdBy = new Array<number>(size);
+  const createdAt = new Array<string>(size);
+  const tenantIds = new Array<number>(size);
+  const branchIds = new Array<number>(size);
+
+  for (let i = 0; i < size; i++) {
+    const row = batch[i];
+    types[i] = row.type;
+    amounts[i] = row.amount;
+    descriptions[i] = row.description ?? null;
+    paymentMethods[i] = row.paymentMethod ?? null;
+    createdBy[i] = row.createdBy;
+    createdAt[i] = (row.createdAt as Date).toISOString();
+    tenantIds[i] = row.tenantId;
+    branchIds[i] = row.branchId;
+  }
+
+  const result = await client.query({
+    name: 'import_transactions_batch',
+    text: INSERT_TRANSACTIONS_BATCH_SQL,
+    values: [types, amounts, descriptions, paymentMethods, createdBy, createdAt, tenantIds, branchIds]
+  });
+  return result.rowCount ?? 0;
+}
+
+// Patient references are checked by joining against patients in the same
+// statement, so tests for unknown patients are skipped server-side instead
+// of being looked up one by one beforehand; skipped tests are reported per
+// patient.
+async function insertPatientTestBatch(
+  client: PoolClient,
+  batch: (typeof patientTests.$inferInsert)[],
+  errors: string[]
+): Promise<number> {
+  const size = batch.length;
+  const patientIds = new Array<number>(size);
+  const testIds = new Array<number>(size);
+  const statuses = new Array<string>(size);
+  const scheduledAt = new Array<string>(size);
+  const completedAt = new Array<string | null>(size);
+  const results = new Array<string | null>(size);
+  const paymentVerified = new Array<boolean>(size);
+  const paymentVerifiedAt = new Array<string | null>(size);
+  const tenantIds = new Array<number>(size);
+  const branchIds = new Array<number>(size);
+
+  for (let i = 0; i < size; i++) {
+    const row = batch[i];
+    patientIds[i] = row.patientId;
+    testIds[i] = row.testId;
+    statuses[i] = row.status ?? 'scheduled';
+    scheduledAt[i] = row.scheduledAt.toISOString();
+    completedAt[i] = row.completedAt ? row.completedAt.toISOString() : null;
+    results[i] = row.results ?? null;
+    paymentVerified[i] = row.paymentVerified ?? false;
+    paymentVerifiedAt[i] = row.paymentVerifiedAt ? row.paymentVerifiedAt.toISOString() : null;
+    tenantIds[i] = row.tenantId;
+    branchIds[i] = row.branchId;
+  }
+
+  const result = await client.query({
+    name: 'import_patient_tests_batch',
+    text: INSERT_PATIENT_TESTS_BATCH_SQL,
+    values: [
+      patientIds, testIds, statuses, scheduledAt, completedAt, results,
+      paymentVerified, paymentVerifiedAt, tenantIds, branchIds
+    ]
+  });
+
+  if (result.rows.length < size) {
+    const known = new Set(result.rows.map((row) => row.patient_id));
+    const skipped = new Map<number, number>();
+    for (const patientId of patientIds) {
+      // Spreadsheet IDs may arrive as numeric strings
+      if (!known.has(Number(patientId))) skipped.set(patientId, (skipped.get(patientId) ?? 0) + 1);
+    }
+    skipped.forEach((count, patientId) => {
+      errors.push(`Skipped ${count} test(s) for patient ${patientId}: patient not found`);
+    });
+  }
+  return result.rows.length;
+}
+
 export class DataImportService {
   constructor(private storage: DatabaseStorage) {}
 
@@ -65,32 +532,32 @@ export class DataImportService {
     let recordsProcessed = 0;
 
     try {
-      for (const patientData of patientsData) {
-        try {
-          await this.storage.createPatient({
-            tenantId: 1,
-            branchId: 1,
-            firstName: patientData.firstName,
-            lastName: patientData.lastName,
-            email: patientData.email || '',
-            phone: patientData.phone || '',
-            dateOfBirth: patientData.dateOfBirth ? new Date(patientData.dateOfBirth) : new Date(),
-            gender: patientData.gender || 'unknown',
-            address: patientData.address || '',
-            emergencyContact: patientData.emergencyContact || '',
-            medicalHistory: patientData.medicalHistory || '',
-            referralSource: patientData.referralSource || 'walk-in'
-          });
-          recordsProcessed++;
-        } catch (error) {
-          errors.push(`Failed to import patient ${patientData.firstName} ${patientData.lastName}: ${error}`);
-        }
-      }
+      const uniquePatients = screenPatients(patientsData, errors);
+
+      // One connection and one commit for the whole import, rather than a
+      // pool checkout and an autocommit per batch. IDs are reserved inside
+      // that transaction so concurrent imports cannot draw the same block.
+      recordsProcessed = await importInTransaction(
+        async (client) => {
+          const patientIds = await this.storage.generatePatientIds(uniquePatients.length, client);
+          return inBatches(
+            uniquePatients,
+            (patientData, index) => normalizePatientRow(patientData, patientIds[index]),
+            COLUMN_ARRAY_BATCH_SIZE
+          );
+        },
+        (client, batch) => insertPatientBatch(client, batch, errors),
+        (row) => `patient ${row.firstName} ${row.lastName}`,
+        errors
+      );
 
       return {
         success: errors.length === 0,
-        message: `Imported ${recordsProcessed} patients successfully`,
+        message: recordsProcessed < patientsData.length
+          ? `Imported ${recordsProcessed} of ${patientsData.length} patients`
+          : `Imported ${recordsProcessed} patients successfully`,
         recordsProcessed,
+        totalRecords: patientsData.length,
         errors
       };
     } catch (error) {
@@ -98,6 +565,44 @@ export class DataImportService {
         success: false,
         message: `Import failed: ${error}`,
         recordsProcessed,
+        totalRecords: patientsData.length,
+        errors: [error as string]
+      };
+    }
+  }
+
+  async importFinancialTransactions(
+    transactionsData: TransactionImportData[],
+    createdBy: number
+  ): Promise<ImportResult> {
+    const errors: string[] = [];
+    let recordsProcessed = 0;
+
+    try {
+      recordsProcessed = await importInTransaction(
+        () => inBatches(
+          transactionsData,
+          (transaction) => normalizeTransactionRow(transaction, createdBy),
+          COLUMN_ARRAY_BATCH_SIZE
+        ),
+        insertTransactionBatch,
+        (row) => `transaction ${row.description || row.amount}`,
+        errors
+      );
+
+      return {
+        success: errors.length === 0,
+        message: `Imported ${recordsProcessed} financial transactions successfully`,
+        recordsProcessed,
+        totalRecords: transactionsData.length,
+        errors
+      };
+    } catch (error) {
+      return {
+        success: false,
+        message: `Transaction import failed: ${error}`,
+        recordsProcessed,
+        totalRecords: transactionsData.length,
         errors: [error as string]
       };
     }
@@ -106,32 +611,28 @@ export class DataImportService {
   async importPatientTests(testsData: TestImportData[]): Promise<ImportResult> {
     const errors: string[] = [];
     let recordsProcessed = 0;
+    // Paid tests in one import share a single verification timestamp
+    const verifiedAt = new Date();
 
     try {
-      for (const testData of testsData) {
-        try {
-          await db.insert(patient_tests).values({
-            patientId: testData.patientId,
-            testId: testData.testId,
-            tenantId: 1,
-            branchId: 1,
-            status: testData.status,
-            scheduledAt: new Date(testData.testDate),
-            completedAt: testData.status === 'completed' ? new Date(testData.testDate) : null,
-            results: testData.results || '',
-            paymentVerified: testData.paymentStatus === 'paid',
-            paymentVerifiedAt: testData.paymentStatus === 'paid' ? new Date() : null
-          });
-          recordsProcessed++;
-        } catch (error) {
-          errors.push(`Failed to import test for patient ${testData.patientId}: ${error}`);
-        }
-      }
+      recordsProcessed = await importInTransaction(
+        () => inBatches(
+          testsData,
+          (testData) => normalizePatientTestRow(testData, verifiedAt),
+          COLUMN_ARRAY_BATCH_SIZE
+        ),
+        (client, batch) => insertPatientTestBatch(client, batch, errors),
+        (row) => `test for patient ${row.patientId}`,
+        errors
+      );
 
       return {
         success: errors.length === 0,
-        message: `Imported ${recordsProcessed} patient tests successfully`,
+        message: recordsProcessed < testsData.length
+          ? `Imported ${recordsProcessed} of ${testsData.length} patient tests`
+          : `Imported ${recordsProcessed} patient tests successfully`,
         recordsProcessed,
+        totalRecords: testsData.length,
         errors
       };
     } catch (error) {
@@ -139,6 +640,7 @@ export class DataImportService {
         success: false,
         message: `Test import failed: ${error}`,
         recordsProcessed,
+        totalRecords: testsData.length,
         errors: [error as string]
       };
     }
@@ -151,7 +653,7 @@ export class DataImportService {
     try {
       for (const item of inventoryData) {
         try {
-          await db.insert(inventory_items).values({
+          await db.insert(inventoryItems).values({
             tenantId: 1,
             itemCode: item.itemCode,
             name: item.name,
@@ -172,6 +674,7 @@ export class DataImportService {
         success: errors.length === 0,
         message: `Imported ${recordsProcessed} inventory items successfully`,
         recordsProcessed,
+        totalRecords: inventoryData.length,
         errors
       };
     } catch (error) {
@@ -179,6 +682,7 @@ export class DataImportService {
         success: false,
         message: `Inventory import failed: ${error}`,
         recordsProcessed,
+        totalRecords: inventoryData.length,
         errors: [error as string]
       };
     }
@@ -213,6 +717,7 @@ export class DataImportService {
         success: errors.length === 0,
         message: `Imported ${recordsProcessed} vendors successfully`,
         recordsProcessed,
+        totalRecords: vendorsData.length,
         errors
       };
     } catch (error) {
@@ -220,6 +725,7 @@ export class DataImportService {
         success: false,
         message: `Vendor import failed: ${error}`,
         recordsProcessed,
+        totalRecords: vendorsData.length,
         errors: [error as string]
       };
     }
@@ -269,6 +775,17 @@ export class DataImportService {
           }
         });
         break;
+
+      case 'financial':
+        data.forEach((item, index) => {
+          if (!item.amount || !item.transactionDate) {
+            errors.push(`Row ${index + 1}: Amount and transaction date are required`);
+          }
+          if (isNaN(parseFloat(item.amount))) {
+            errors.push(`Row ${index + 1}: Invalid amount format`);
+          }
+        });
+        break;
     }
 
     return {
@@ -278,8 +795,7 @@ export class DataImportService {
   }
 
   private validateEmail(email: string): boolean {
-    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-    return emailRegex.test(email);
+    return EMAIL_PATTERN.test(email);
   }
 
   async getImportSummary(): Promise<{
@@ -289,8 +805,8 @@ export class DataImportService {
     vendors: number;
   }> {
     const [patientsCount] = await db.select().from(patients).where({ tenantId: 1 });
-    const [testsCount] = await db.select().from(patient_tests).where({ tenantId: 1 });
-    const [inventoryCount] = await db.select().from(inventory_items).where({ tenantId: 1 });
+    const [testsCount] = await db.select().from(patientTests).where({ tenantId: 1 });
+    const [inventoryCount] = await db.select().from(inventoryItems).where({ tenantId: 1 });
     const [vendorsCount] = await db.select().from(vendors).where({ tenantId: 1 });
 
     return {
@@ -300,4 +816,6 @@ export class DataImportService {
       vendors: vendorsCount ? 1 : 0
     };
   }
-}
\ No newline at end of file
+}
+
+export const dataImportService = new DataImportService(storage);
@@ -29,7 +29,7 @@ export class InventoryStorage {
 
   // Inventory Items
   async getInventoryItems(tenantId: number, categoryId?: number) {
-    let query = `
+    const result = await db.execute(sql`
       SELECT i.*, c.name as category_name,
              COALESCE(SUM(s.available_quantity), 0) as total_available,
              COALESCE(SUM(s.reserved_quantity), 0) as total_reserved
@@ -37,15 +37,9 @@ export class InventoryStorage {
       LEFT JOIN inventory_categories c ON c.id = i.category_id
       LEFT JOIN inventory_stock s ON s.item_id = i.id
       WHERE i.tenant_id = ${tenantId} AND i.is_active = true
-    `;
-    
-    if (categoryId) {
-      query += ` AND i.category_id = ${categoryId}`;
-    }
-    
-    query += ` GROUP BY i.id, c.name ORDER BY i.name ASC`;
-    
-    const result = await db.execute(sql.raw(query));
+      ${categoryId ? sql`AND i.category_id = ${categoryId}` : sql``}
+      GROUP BY i.id, c.name ORDER BY i.name ASC
+    `);
     return result.rows;
   }
 
@@ -89,7 +83,7 @@ export class InventoryStorage {
 
   // Inventory Stock Management
   async getInventoryStock(tenantId: number, branchId: number, itemId?: number) {
-    let query = `
+    const result = await db.execute(sql`
       SELECT s.*, i.name as item_name, i.item_code, i.unit_of_measure,
              i.minimum_stock, i.reorder_level, c.name as category_name,
              CASE 
@@ -101,15 +95,9 @@ export class InventoryStorage {
       JOIN inventory_items i ON i.id = s.item_id
       LEFT JOIN inventory_categories c ON c.id = i.category_id
       WHERE s.tenant_id = ${tenantId} AND s.branch_id = ${branchId}
-    `;
-    
-    if (itemId) {
-      query += ` AND s.item_id = ${itemId}`;
-    }
-    
-    query += ` ORDER BY i.name ASC`;
-    
-    const result = await db.execute(sql.raw(query));
+      ${itemId ? sql`AND s.item_id = ${itemId}` : sql``}
+      ORDER BY i.name ASC
+    `);
     return result.rows;
   }
 
@@ -215,31 +203,22 @@ export class InventoryStorage {
   }
 
   async getInventoryTransactions(tenantId: number, branchId?: number, itemId?: number, limit = 50) {
-    let query = `
+    const result = await db.execute(sql`
       SELECT t.*, i.name as item_name, i.item_code, u.username as performed_by_username
       FROM inventory_transactions t
       JOIN inventory_items i ON i.id = t.item_id
       LEFT JOIN users u ON u.id = t.performed_by
       WHERE t.tenant_id = ${tenantId}
-    `;
-    
-    if (branchId) {
-      query += ` AND t.branch_id = ${branchId}`;
-    }
-    
-    if (itemId) {
-      query += ` AND t.item_id = ${itemId}`;
-    }
-    
-    query += ` ORDER BY t.created_at DESC LIMIT ${limit}`;
-    
-    const result = await db.execute(sql.raw(query));
+      ${branchId ? sql`AND t.branch_id = ${branchId}` : sql``}
+      ${itemId ? sql`AND t.item_id = ${itemId}` : sql``}
+      ORDER BY t.created_at DESC LIMIT ${limit}
+    `);
     return result.rows;
   }
 
   // Low Stock Alerts
   async getLowStockItems(tenantId: number, branchId?: number) {
-    let query = `
+    const result = await db.execute(sql`
       SELECT s.*, i.name as item_name, i.item_code, i.unit_of_measure,
              i.minimum_stock, i.reorder_level, c.name as category_name
       FROM inventory_stock s
@@ -248,15 +227,9 @@ export class InventoryStorage {
       WHERE s.tenant_id = ${tenantId} 
         AND i.is_active = true
         AND s.available_quantity <= i.reorder_level
-    `;
-    
-    if (branchId) {
-      query += ` AND s.branch_id = ${branchId}`;
-    }
-    
-    query += ` ORDER BY s.available_quantity ASC`;
-    
-    const result = await db.execute(sql.raw(query));
+        ${branchId ? sql`AND s.branch_id = ${branchId}` : sql``}
+      ORDER BY s.available_quantity ASC
+    `);
     return result.rows;
   }
 
@@ -265,7 +238,7 @@ export class InventoryStorage {
     const expiryDate = new Date();
     expiryDate.setDate(expiryDate.getDate() + daysAhead);
     
-    let query = `
+    const result = await db.execute(sql`
       SELECT t.*, i.name as item_name, i.item_code, i.unit_of_measure,
              s.available_quantity, c.name as category_name
       FROM inventory_transactions t
@@ -274,24 +247,18 @@ export class InventoryStorage {
       LEFT JOIN inventory_categories c ON c.id = i.category_id
       WHERE t.tenant_id = ${tenantId}
         AND t.expiry_date IS NOT NULL
-        AND t.expiry_date <= '${expiryDate.toISOString().split('T')[0]}'
+        AND t.expiry_date <= ${expiryDate.toISOString().split('T')[0]}
         AND i.expiry_tracking = true
         AND i.is_active = true
-    `;
-    
-    if (branchId) {
-      query += ` AND t.branch_id = ${branchId}`;
-    }
-    
-    query += ` ORDER BY t.expiry_date ASC`;
-    
-    const result = await db.execute(sql.raw(query));
+        ${branchId ? sql`AND t.branch_id = ${branchId}` : sql``}
+      ORDER BY t.expiry_date ASC
+    `);
     return result.rows;
   }
 
   // Inventory Valuation
   async getInventoryValuation(tenantId: number, branchId?: number) {
-    let query = `
+    const result = await db.execute(sql`
       SELECT 
         SUM(s.available_quantity * s.average_cost) as total_value,
         COUNT(DISTINCT s.item_id) as total_items,
@@ -299,13 +266,8 @@ export class InventoryStorage {
       FROM inventory_stock s
       JOIN inventory_items i ON i.id = s.item_id
       WHERE s.tenant_id = ${tenantId} AND i.is_active = true
-    `;
-    
-    if (branchId) {
-      query += ` AND s.branch_id = ${branchId}`;
-    }
-    
-    const result = await db.execute(sql.raw(query));
+      ${branchId ? sql`AND s.branch_id = ${branchId}` : sql``}
+    `);
     return result.rows[0];
   }
 }
@@ -411,18 +411,16 @@ export class RBACStorage {
         tenantId
       });
 
-    // Keep only last 12 passwords
-    const allPasswords = await db.select()
-      .from(rbacSchema.passwordHistory)
-      .where(eq(rbacSchema.passwordHistory.userId, userId))
-      .orderBy(desc(rbacSchema.passwordHistory.createdAt));
-
-    if (allPasswords.length > 12) {
-      const oldPasswords = allPasswords.slice(12);
-      const oldIds = oldPasswords.map(p => p.id);
-      await db.delete(rbacSchema.passwordHistory)
-        .where(inArray(rbacSchema.passwordHistory.id, oldIds));
-    }
+    // Keep only last 12 passwords, trimmed server-side in one statement
+    await db.delete(rbacSchema.passwordHistory)
+      .where(inArray(
+        rbacSchema.passwordHistory.id,
+        db.select({ id: rbacSchema.passwordHistory.id })
+          .from(rbacSchema.passwordHistory)
+          .where(eq(rbacSchema.passwordHistory.userId, userId))
+          .orderBy(desc(rbacSchema.passwordHistory.createdAt))
+          .offset(12)
+      ));
   }
 
   async checkPasswordHistory(userId: number, newPasswordHash: string): Promise<boolean> {
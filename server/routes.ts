@@ -54,6 +54,7 @@ import {
 } from "drizzle-orm";
 import { notificationService, PDFService } from "./notifications";
 import { brandingStorage } from "./branding-storage";
+import { dataImportService } from "./data-import";
 import { seedRBACSystem, assignUserRole } from "./rbac-seed";
 import { z } from "zod";
 import { insertPatientSchema, insertPatientTestSchema, insertTransactionSchema } from "@shared/schema";
@@ -3360,17 +3361,16 @@ export function registerRoutes(app: Express): Server {
       });
 
       // Create patient tests for each test in the invoice
-      for (const test of invoiceData.tests) {
-        await storage.createPatientTest({
-          patientId: invoiceData.patientId,
-          testId: test.testId,
-          status: "pending",
-          scheduledAt: new Date(),
-          tenantId: invoiceData.tenantId,
-          branchId: invoiceData.branchId,
-          technicianId: req.user.id
-        });
-      }
+      const scheduledAt = new Date();
+      await storage.createPatientTests(invoiceData.tests.map((test: any) => ({
+        patientId: invoiceData.patientId,
+        testId: test.testId,
+        status: "pending",
+        scheduledAt,
+        tenantId: invoiceData.tenantId,
+        branchId: invoiceData.branchId,
+        technicianId: req.user.id
+      })));
 
       res.json({ success: true, invoice });
     } catch (error) {
@@ -14257,38 +14257,8 @@ Medical System Procurement Team
         return res.status(400).json({ message: "Invalid data format. Expected array of patients." });
       }
 
-      let successCount = 0;
-      let errors: string[] = [];
-
-      for (const patientData of patientsData) {
-        try {
-          await storage.createPatient({
-            tenantId: 1,
-            branchId: 1,
-            firstName: patientData.firstName,
-            lastName: patientData.lastName,
-            email: patientData.email || '',
-            phone: patientData.phone || '',
-            dateOfBirth: patientData.dateOfBirth ? new Date(patientData.dateOfBirth) : new Date('1990-01-01'),
-            gender: patientData.gender || 'unknown',
-            address: patientData.address || '',
-            emergencyContact: patientData.emergencyContact || '',
-            medicalHistory: patientData.medicalHistory || '',
-            referralSource: patientData.referralSource || 'walk-in'
-          });
-          successCount++;
-        } catch (error: any) {
-          errors.push(`Failed to import patient ${patientData.firstName} ${patientData.lastName}: ${error.message}`);
-        }
-      }
-
-      res.json({
-        success: errors.length === 0,
-        message: `Imported ${successCount} patients successfully`,
-        recordsProcessed: successCount,
-        totalRecords: patientsData.length,
-        errors
-      });
+      const result = await dataImportService.importPatients(patientsData);
+      res.json(result);
     } catch (error: any) {
       console.error("Error importing patients:", error);
       res.status(500).json({ message: "Internal server error" });
@@ -14308,41 +14278,31 @@ Medical System Procurement Team
         return res.status(400).json({ message: "Invalid data format. Expected array of transactions." });
       }
 
-      let successCount = 0;
-      let errors: string[] = [];
+      const result = await dataImportService.importFinancialTransactions(transactionsData, req.user?.id || 1);
+      res.json(result);
+    } catch (error: any) {
+      console.error("Error importing financial transactions:", error);
+      res.status(500).json({ message: "Internal server error" });
+    }
+  });
 
-      for (const transaction of transactionsData) {
-        try {
-          await db.insert(transactions).values({
-            tenantId: 1,
-            branchId: 1,
-            type: transaction.type || 'income',
-            category: transaction.category || 'patient_services',
-            amount: transaction.amount.toString(),
-            description: transaction.description || '',
-            transactionDate: new Date(transaction.transactionDate),
-            paymentMethod: transaction.paymentMethod || 'cash',
-            referenceNumber: transaction.referenceNumber || '',
-            status: transaction.status || 'completed',
-            createdBy: req.user?.id || 1,
-            verifiedBy: transaction.status === 'verified' ? req.user?.id || 1 : null,
-            verifiedAt: transaction.status === 'verified' ? new Date() : null
-          });
-          successCount++;
-        } catch (error: any) {
-          errors.push(`Failed to import transaction ${transaction.referenceNumber}: ${error.message}`);
-        }
+  // Import patient tests from historical data
+  app.post("/api/data-import/patient-tests", async (req, res) => {
+    try {
+      if (!req.isAuthenticated()) {
+        return res.status(401).json({ message: "Unauthorized" });
       }
 
-      res.json({
-        success: errors.length === 0,
-        message: `Imported ${successCount} financial transactions successfully`,
-        recordsProcessed: successCount,
-        totalRecords: transactionsData.length,
-        errors
-      });
+      const { testsData } = req.body;
+      
+      if (!Array.isArray(testsData)) {
+        return res.status(400).json({ message: "Invalid data format. Expected array of patient tests." });
+      }
+
+      const result = await dataImportService.importPatientTests(testsData);
+      res.json(result);
     } catch (error: any) {
-      console.error("Error importing financial transactions:", error);
+      console.error("Error importing patient tests:", error);
       res.status(500).json({ message: "Internal server error" });
     }
   });
@@ -14379,34 +14339,10 @@ Medical System Procurement Team
       }
 
       const { data, type } = req.body;
-      const errors: string[] = [];
-
-      switch (type) {
-        case 'patients':
-          data.forEach((item: any, index: number) => {
-            if (!item.firstName || !item.lastName) {
-              errors.push(`Row ${index + 1}: First name and last name are required`);
-            }
-            if (item.email && !/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(item.email)) {
-              errors.push(`Row ${index + 1}: Invalid email format`);
-            }
-          });
-          break;
-
-        case 'financial':
-          data.forEach((item: any, index: number) => {
-            if (!item.amount || !item.transactionDate) {
-              errors.push(`Row ${index + 1}: Amount and transaction date are required`);
-            }
-            if (isNaN(parseFloat(item.amount))) {
-              errors.push(`Row ${index + 1}: Invalid amount format`);
-            }
-          });
-          break;
-      }
+      const { valid, errors } = await dataImportService.validateImportData(data, type);
 
       res.json({
-        valid: errors.length === 0,
+        valid,
         errors,
         recordCount: data.length
       });
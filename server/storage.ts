@@ -55,7 +55,9 @@ import {
   type InsertRecognitionEvent
 } from "@shared/schema";
 import { db } from "./db";
-import { eq, and, or, desc, sql, between, ilike, gte, lte } from "drizzle-orm";
+import { drizzle } from "drizzle-orm/node-postgres";
+import type { PoolClient } from "pg";
+import { eq, and, or, desc, sql, between, ilike, like, gte, lte } from "drizzle-orm";
 import session from "express-session";
 import connectPg from "connect-pg-simple";
 import { pool } from "./db";
@@ -84,6 +86,7 @@ export interface IStorage {
   getPatient(id: number): Promise<Patient | undefined>;
   createPatient(patient: InsertPatient): Promise<Patient>;
   generatePatientId(tenantId: number): Promise<string>;
+  generatePatientIds(quantity: number, client?: PoolClient): Promise<string[]>;
   searchPatients(branchId: number, query: string): Promise<Patient[]>;
   
   // Patient tests management
@@ -91,6 +94,7 @@ export interface IStorage {
   getPatientTestsByCategory(branchId: number, category: string, limit?: number): Promise<any[]>;
   getRecentPatientTests(branchId: number, limit?: number): Promise<any[]>;
   createPatientTest(patientTest: InsertPatientTest): Promise<PatientTest>;
+  createPatientTests(patientTests: InsertPatientTest[]): Promise<void>;
   updatePatientTestStatus(id: number, status: string): Promise<void>;
   updatePatientTestResults(id: number, results: string, notes?: string, updatedBy?: number): Promise<void>;
   
@@ -239,19 +243,35 @@ export class DatabaseStorage implements IStorage {
   }
 
   async generatePatientId(tenantId: number): Promise<string> {
-    const year = new Date().getFullYear();
-    const count = await db
-      .select({ count: sql<number>`count(*)` })
+    const [patientId] = await this.generatePatientIds(1);
+    return patientId;
+  }
+
+  // Reserve a contiguous block of patient IDs with a single lookup. Numbering
+  // continues from the highest ID issued this year rather than a row count,
+  // which falls behind once patients are deleted; IDs are unique across
+  // tenants, so the search is not scoped to one. Given the client of an open
+  // transaction, the lookup runs there behind a transaction-scoped advisory
+  // lock, so a concurrent import waits until these IDs are committed.
+  async generatePatientIds(quantity: number, client?: PoolClient): Promise<string[]> {
+    if (client) {
+      await client.query("SELECT pg_advisory_xact_lock(hashtext('patients.patient_id'))");
+    }
+    const executor = client ? drizzle(client) : db;
+    const prefix = `P-${new Date().getFullYear()}-`;
+    const [latest] = await executor
+      .select({
+        lastNumber: sql<number | null>`max(substring(${patients.patientId} from '[0-9]+$')::int)`
+      })
       .from(patients)
-      .where(
-        and(
-          eq(patients.tenantId, tenantId),
-          sql`EXTRACT(YEAR FROM created_at) = ${year}`
-        )
-      );
-    
-    const nextNumber = (count[0]?.count || 0) + 1;
-    return `P-${year}-${String(nextNumber).padStart(3, '0')}`;
+      .where(like(patients.patientId, `${prefix}%`));
+
+    const firstNumber = Number(latest?.lastNumber ?? 0) + 1;
+    const patientIds = new Array<string>(quantity);
+    for (let offset = 0; offset < quantity; offset++) {
+      patientIds[offset] = prefix + String(firstNumber + offset).padStart(3, '0');
+    }
+    return patientIds;
   }
 
   async searchPatients(branchId: number, query: string): Promise<Patient[]> {
@@ -410,6 +430,23 @@ export class DatabaseStorage implements IStorage {
     return result.rows[0] as PatientTest;
   }
 
+  // Insert several patient tests in one statement, for callers that do not
+  // need the created rows back.
+  async createPatientTests(insertPatientTests: InsertPatientTest[]): Promise<void> {
+    if (insertPatientTests.length === 0) return;
+
+    const rows = insertPatientTests.map(pt => sql`
+      (${pt.patientId}, ${pt.testId}, ${pt.status || 'scheduled'}, ${pt.scheduledAt || new Date()},
+       ${pt.branchId}, ${pt.tenantId}, ${pt.notes || null}, NOW(), NOW())
+    `);
+
+    await db.execute(sql`
+      INSERT INTO patient_tests 
+        (patient_id, test_id, status, scheduled_at, branch_id, tenant_id, notes, created_at, updated_at)
+      VALUES ${sql.join(rows, sql`, `)}
+    `);
+  }
+
   async updatePatientTestStatus(id: number, status: string): Promise<void> {
     await db
       .update(patientTests)